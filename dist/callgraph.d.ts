@@ -2,7 +2,8 @@
  * ArkUI Lifecycle Call Graph Data Structure
  *
  * This module provides a simple graph representation for function call sequences
- * extracted from ArkUI lifecycle analysis JSON output.
+ * extracted from ArkUI lifecycle analysis JSON output, or from the columnar
+ * binary format (.alcg) written by the Python backend.
  */
 /**
  * Represents a function node in the call graph
@@ -28,8 +29,9 @@ export interface Edge {
  * Call graph data structure representing ArkUI lifecycle function calls
  */
 export declare class CallGraph {
-    private nodes;
-    private edges;
+    private nodes?;
+    private edges?;
+    private columns?;
     private dynamicBehavior?;
     /**
      * Creates a new CallGraph instance
@@ -45,6 +47,28 @@ export declare class CallGraph {
      * @throws Error if JSON parsing fails or required fields are missing
      */
     static fromJSON(jsonStr: string): CallGraph;
+    /**
+     * Constructs a CallGraph from the columnar binary format (.alcg) without
+     * copying: node and edge ids are typed array views over the given buffer,
+     * and strings are decoded on first access.
+     * @param buffer - Binary content, e.g. the Buffer returned by readFileSync
+     * @returns A new CallGraph instance
+     * @throws Error if the buffer is not a valid binary call graph
+     */
+    static fromBuffer(buffer: ArrayBuffer | ArrayBufferView): CallGraph;
+    /**
+     * Decodes (and caches) a string from the interned string table
+     */
+    private static decodeString;
+    /**
+     * Returns the columnar representation, building it once for JSON-backed graphs
+     */
+    private getColumns;
+    /**
+     * Serializes the graph to the columnar binary format (.alcg)
+     * @returns Binary content readable by CallGraph.fromBuffer
+     */
+    toBuffer(): Uint8Array;
     /**
      * Returns all function nodes in the graph
      */
@@ -53,6 +77,16 @@ export declare class CallGraph {
      * Returns all edges (call relationships) in the graph
      */
     getEdges(): Edge[];
+    /**
+     * Returns edges as (pred, succ) string id pairs without allocating objects.
+     * For graphs loaded with fromBuffer this is a view over the source buffer.
+     */
+    getEdgeIds(): Uint32Array;
+    /**
+     * Returns the string for an id from getEdgeIds
+     * @param id - Interned string id
+     */
+    getString(id: number): string;
     /**
      * Returns the dynamic behavior description if available
      */
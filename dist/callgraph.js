@@ -2,8 +2,21 @@
  * ArkUI Lifecycle Call Graph Data Structure
  *
  * This module provides a simple graph representation for function call sequences
- * extracted from ArkUI lifecycle analysis JSON output.
+ * extracted from ArkUI lifecycle analysis JSON output, or from the columnar
+ * binary format (.alcg) written by the Python backend.
  */
+/** Magic bytes "ALCG" read as a little-endian uint32 */
+const MAGIC = 0x47434c41;
+/** Binary format version understood by this module */
+const FORMAT_VERSION = 1;
+/** Size of the fixed binary header in bytes */
+const HEADER_BYTES = 28;
+/** String id used when dynamicBehavior is absent */
+const NO_STRING = 0xffffffff;
+/** Typed array views follow host byte order; the format is little-endian */
+const LITTLE_ENDIAN = new Uint8Array(new Uint32Array([1]).buffer)[0] === 1;
+const decoder = new TextDecoder("utf-8");
+const encoder = new TextEncoder();
 /**
  * Call graph data structure representing ArkUI lifecycle function calls
  */
@@ -59,18 +72,199 @@ export class CallGraph {
             throw error;
         }
     }
+    /**
+     * Constructs a CallGraph from the columnar binary format (.alcg) without
+     * copying: node and edge ids are typed array views over the given buffer,
+     * and strings are decoded on first access.
+     * @param buffer - Binary content, e.g. the Buffer returned by readFileSync
+     * @returns A new CallGraph instance
+     * @throws Error if the buffer is not a valid binary call graph
+     */
+    static fromBuffer(buffer) {
+        let bytes = buffer instanceof ArrayBuffer
+            ? new Uint8Array(buffer)
+            : new Uint8Array(buffer.buffer, buffer.byteOffset, buffer.byteLength);
+        if (!LITTLE_ENDIAN) {
+            throw new Error("Failed to parse buffer: big-endian hosts are not supported");
+        }
+        if (bytes.byteLength < HEADER_BYTES) {
+            throw new Error("Failed to parse buffer: truncated header");
+        }
+        // Uint32Array views need 4-byte alignment; copy only if the source is misaligned
+        if (bytes.byteOffset % 4 !== 0) {
+            bytes = bytes.slice();
+        }
+        const header = new DataView(bytes.buffer, bytes.byteOffset, HEADER_BYTES);
+        if (header.getUint32(0, true) !== MAGIC) {
+            throw new Error("Failed to parse buffer: not a binary call graph");
+        }
+        const version = header.getUint16(4, true);
+        if (version !== FORMAT_VERSION) {
+            throw new Error(`Failed to parse buffer: unsupported version ${version}`);
+        }
+        const stringCount = header.getUint32(8, true);
+        const nodeCount = header.getUint32(12, true);
+        const edgeCount = header.getUint32(16, true);
+        const stringLength = header.getUint32(20, true);
+        const dynamicId = header.getUint32(24, true);
+        const idBytes = 4 * (stringCount + 1 + nodeCount * 3 + edgeCount * 2);
+        if (bytes.byteLength < HEADER_BYTES + idBytes + stringLength) {
+            throw new Error("Failed to parse buffer: truncated content");
+        }
+        let offset = bytes.byteOffset + HEADER_BYTES;
+        const view = (length) => {
+            const array = new Uint32Array(bytes.buffer, offset, length);
+            offset += length * 4;
+            return array;
+        };
+        const columns = {
+            offsets: view(stringCount + 1),
+            nodeIds: view(nodeCount * 3),
+            edgeIds: view(edgeCount * 2),
+            stringBytes: new Uint8Array(bytes.buffer, offset, stringLength),
+            strings: new Array(stringCount),
+            dynamicId,
+        };
+        const graph = new CallGraph([], []);
+        graph.nodes = undefined;
+        graph.edges = undefined;
+        graph.columns = columns;
+        graph.dynamicBehavior =
+            dynamicId === NO_STRING ? undefined : CallGraph.decodeString(columns, dynamicId);
+        return graph;
+    }
+    /**
+     * Decodes (and caches) a string from the interned string table
+     */
+    static decodeString(columns, id) {
+        let value = columns.strings[id];
+        if (value === undefined) {
+            value = decoder.decode(columns.stringBytes.subarray(columns.offsets[id], columns.offsets[id + 1]));
+            columns.strings[id] = value;
+        }
+        return value;
+    }
+    /**
+     * Returns the columnar representation, building it once for JSON-backed graphs
+     */
+    getColumns() {
+        if (this.columns) {
+            return this.columns;
+        }
+        const ids = new Map();
+        const strings = [];
+        const intern = (value) => {
+            const key = value ?? "";
+            let id = ids.get(key);
+            if (id === undefined) {
+                id = strings.length;
+                ids.set(key, id);
+                strings.push(key);
+            }
+            return id;
+        };
+        const nodes = this.nodes ?? [];
+        const edges = this.edges ?? [];
+        const nodeIds = new Uint32Array(nodes.length * 3);
+        nodes.forEach((node, i) => {
+            nodeIds[i * 3] = intern(node.name);
+            nodeIds[i * 3 + 1] = intern(node.scope);
+            nodeIds[i * 3 + 2] = intern(node.description);
+        });
+        const edgeIds = new Uint32Array(edges.length * 2);
+        edges.forEach((edge, i) => {
+            edgeIds[i * 2] = intern(edge.pred);
+            edgeIds[i * 2 + 1] = intern(edge.succ);
+        });
+        const dynamicId = this.dynamicBehavior === undefined ? NO_STRING : intern(this.dynamicBehavior);
+        const encoded = strings.map((value) => encoder.encode(value));
+        const offsets = new Uint32Array(strings.length + 1);
+        encoded.forEach((item, i) => {
+            offsets[i + 1] = offsets[i] + item.length;
+        });
+        const stringBytes = new Uint8Array(offsets[strings.length]);
+        encoded.forEach((item, i) => stringBytes.set(item, offsets[i]));
+        this.columns = { stringBytes, offsets, nodeIds, edgeIds, strings, dynamicId };
+        return this.columns;
+    }
+    /**
+     * Serializes the graph to the columnar binary format (.alcg)
+     * @returns Binary content readable by CallGraph.fromBuffer
+     */
+    toBuffer() {
+        const columns = this.getColumns();
+        const stringCount = columns.offsets.length - 1;
+        const idLength = columns.offsets.length + columns.nodeIds.length + columns.edgeIds.length;
+        const bytes = new Uint8Array(HEADER_BYTES + idLength * 4 + columns.stringBytes.length);
+        const header = new DataView(bytes.buffer, 0, HEADER_BYTES);
+        header.setUint32(0, MAGIC, true);
+        header.setUint16(4, FORMAT_VERSION, true);
+        header.setUint16(6, 0, true);
+        header.setUint32(8, stringCount, true);
+        header.setUint32(12, columns.nodeIds.length / 3, true);
+        header.setUint32(16, columns.edgeIds.length / 2, true);
+        header.setUint32(20, columns.stringBytes.length, true);
+        header.setUint32(24, columns.dynamicId, true);
+        const ids = new Uint32Array(bytes.buffer, HEADER_BYTES, idLength);
+        ids.set(columns.offsets, 0);
+        ids.set(columns.nodeIds, columns.offsets.length);
+        ids.set(columns.edgeIds, columns.offsets.length + columns.nodeIds.length);
+        bytes.set(columns.stringBytes, HEADER_BYTES + idLength * 4);
+        return bytes;
+    }
     /**
      * Returns all function nodes in the graph
      */
     getNodes() {
+        if (!this.nodes) {
+            const columns = this.getColumns();
+            const ids = columns.nodeIds;
+            this.nodes = [];
+            for (let i = 0; i < ids.length; i += 3) {
+                this.nodes.push({
+                    name: CallGraph.decodeString(columns, ids[i]),
+                    scope: CallGraph.decodeString(columns, ids[i + 1]),
+                    description: CallGraph.decodeString(columns, ids[i + 2]),
+                });
+            }
+        }
         return [...this.nodes];
     }
     /**
      * Returns all edges (call relationships) in the graph
      */
     getEdges() {
+        if (!this.edges) {
+            const columns = this.getColumns();
+            const ids = columns.edgeIds;
+            this.edges = [];
+            for (let i = 0; i < ids.length; i += 2) {
+                this.edges.push({
+                    pred: CallGraph.decodeString(columns, ids[i]),
+                    succ: CallGraph.decodeString(columns, ids[i + 1]),
+                });
+            }
+        }
         return [...this.edges];
     }
+    /**
+     * Returns edges as (pred, succ) string id pairs without allocating objects.
+     * For graphs loaded with fromBuffer this is a view over the source buffer.
+     */
+    getEdgeIds() {
+        return this.getColumns().edgeIds;
+    }
+    /**
+     * Returns the string for an id from getEdgeIds
+     * @param id - Interned string id
+     */
+    getString(id) {
+        const columns = this.getColumns();
+        if (id < 0 || id >= columns.offsets.length - 1) {
+            throw new RangeError(`String id out of range: ${id}`);
+        }
+        return CallGraph.decodeString(columns, id);
+    }
     /**
      * Returns the dynamic behavior description if available
      */
@@ -81,13 +275,13 @@ export class CallGraph {
      * Returns the number of nodes in the graph
      */
     getNodeCount() {
-        return this.nodes.length;
+        return this.nodes ? this.nodes.length : this.getColumns().nodeIds.length / 3;
     }
     /**
      * Returns the number of edges in the graph
      */
     getEdgeCount() {
-        return this.edges.length;
+        return this.edges ? this.edges.length : this.getColumns().edgeIds.length / 2;
     }
 }
 //# sourceMappingURL=callgraph.js.map
\ No newline at end of file
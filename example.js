@@ -35,4 +35,15 @@ if (behavior) {
   console.log(`\n动态行为:\n  ${behavior}`);
 }
 
+// 6. 从二进制调用图（.alcg）零拷贝加载
+const binaryPath = 'data/outputs/json/output1.alcg';
+const binaryGraph = CallGraph.fromBuffer(readFileSync(binaryPath));
+console.log(`\n二进制格式: ${binaryGraph.getNodeCount()} 个节点, ${binaryGraph.getEdgeCount()} 条边`);
+
+// 按字符串 ID 遍历边，不创建边对象
+const edgeIds = binaryGraph.getEdgeIds();
+for (let i = 0; i < edgeIds.length; i += 2) {
+  console.log(`  ${binaryGraph.getString(edgeIds[i])} → ${binaryGraph.getString(edgeIds[i + 1])}`);
+}
+
 console.log('\n✓ 示例执行完成');
@@ -3,6 +3,7 @@ ArkUI 生命周期分析 RAG 系统 - 主入口
 """
 
 import argparse
+import json
 import sys
 from pathlib import Path
 from dotenv import load_dotenv
@@ -13,6 +14,11 @@ sys.path.insert(0, str(Path(__file__).parent / "src"))
 from src.config import Config
 from src.vectorstore import VectorStoreManager
 from src.rag_engine import RAGEngine
+from src.dependency import ComponentDependencyGraph
+from src.log_ingest import LifecycleLogIngester
+from src.incremental import (
+    analysis_fingerprint, current_revision, plan_incremental, load_manifest, save_manifest, scene_output_name
+)
 from src.utils import read_input_file, save_output, print_banner, safe_print
 
 
@@ -40,6 +46,76 @@ def index_documents(config: Config, force: bool = False):
     safe_print("✅ 索引创建完成！")
 
 
+def create_rag_engine(config: Config) -> RAGEngine:
+    """
+    加载向量库并创建 RAG 引擎
+
+    Args:
+        config: 配置对象
+
+    Returns:
+        RAG 引擎实例
+    """
+    vectorstore_manager = VectorStoreManager(
+        persist_directory=config.vector_store_path
+    )
+    vectorstore_manager.load_vectorstore()
+
+    return RAGEngine(
+        vectorstore_manager=vectorstore_manager,
+        model_name=config.model_name,
+        temperature=config.temperature,
+        retriever_k=config.retriever_k,
+        decompose_threshold=config.decompose_threshold,
+        decompose_mode=config.decompose_mode,
+        max_concurrency=config.max_concurrency,
+        model_cascade=config.model_cascade,
+        scene_deadline=config.scene_deadline,
+        hedge_percentile=config.hedge_percentile,
+        hedge_min_samples=config.hedge_min_samples
+    )
+
+
+def print_latency_stats(rag_engine: RAGEngine):
+    """
+    按调用类别打印 LLM 调用的延迟分位数和对冲率
+
+    Args:
+        rag_engine: RAG 引擎
+    """
+    for key, stats in rag_engine.invoker.stats().items():
+        if not stats["calls"]:
+            continue
+
+        # 全部超时时没有成功调用的延迟样本
+        latency = " / ".join(
+            f"{name} {'-' if stats[name] is None else f'{stats[name]:.1f}s'}" for name in ("p50", "p95", "p99")
+        )
+        safe_print(
+            f"⏱️  {key} 调用 {stats['calls']} 次: {latency}，"
+            f"对冲率 {stats['hedge_rate']:.0%}，超时 {stats['timeouts']} 次"
+        )
+
+
+def print_cascade_stats(rag_engine: RAGEngine):
+    """
+    打印模型级联各层的升级率
+
+    Args:
+        rag_engine: RAG 引擎
+    """
+    if not rag_engine.cascade_stats:
+        return
+
+    safe_print("📊 模型级联统计:")
+    rates = rag_engine.escalation_rates()
+    for model_name, stats in rag_engine.cascade_stats.items():
+        safe_print(
+            f"  {model_name}: 调用 {stats['calls']} 次，升级 {stats['escalations']} 次 "
+            f"(升级率 {rates[model_name]:.0%})"
+        )
+
+
 def analyze_lifecycle(config: Config, input_file: Path = None, output_file: str = None):
     """
     执行生命周期分析
@@ -51,41 +127,180 @@ def analyze_lifecycle(config: Config, input_file: Path = None, output_file: str
     """
     print_banner("ArkUI 生命周期分析 RAG 系统")
 
+    rag_engine = None
     try:
         # 1. 读取输入
         input_path = input_file or config.input_file
         scene_text = read_input_file(input_path)
 
-        # 2. 初始化向量库管理器
-        vectorstore_manager = VectorStoreManager(
-            persist_directory=config.vector_store_path
-        )
-        vectorstore_manager.load_vectorstore()
-
-        # 3. 创建 RAG 引擎
-        rag_engine = RAGEngine(
-            vectorstore_manager=vectorstore_manager,
-            model_name=config.model_name,
-            temperature=config.temperature,
-            retriever_k=config.retriever_k
-        )
+        # 2. 初始化向量库并创建 RAG 引擎
+        rag_engine = create_rag_engine(config)
 
-        # 4. 执行分析
+        # 3. 执行分析
         result = rag_engine.analyze(
             scene_text,
             api_key=config.api_key,
             api_base=config.api_base
         )
 
-        # 5. 输出结果
+        # 4. 输出结果
         safe_print("=" * 60)
         safe_print("📜 生命周期调用顺序分析结果")
         safe_print("=" * 60)
         safe_print(result)
         safe_print("")
 
-        # 6. 保存结果
-        save_output(result, config.output_dir, output_file)
+        # 5. 保存结果
+        save_output(result, config.output_dir, output_file, config.output_format)
+        print_cascade_stats(rag_engine)
+        print_latency_stats(rag_engine)
+
+    except FileNotFoundError as e:
+        safe_print(f"\n❌ 文件错误: {e}")
+        sys.exit(1)
+    except ValueError as e:
+        safe_print(f"\n❌ 数据错误: {e}")
+        sys.exit(1)
+    except Exception as e:
+        safe_print(f"\n❌ 执行失败: {type(e).__name__}: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        if rag_engine is not None:
+            rag_engine.close()
+
+
+def incremental_analyze(config: Config, revision_range: str = None, scenes_dir: Path = None):
+    """
+    增量分析：仅重新分析受 git 变更影响的场景，其余复用已保存结果
+
+    Args:
+        config: 配置对象
+        revision_range: git 修订范围（如 "origin/main..HEAD"），为 None 时全量分析
+        scenes_dir: 场景目录（可选）
+    """
+    print_banner("ArkUI 生命周期增量分析")
+
+    rag_engine = None
+    try:
+        scenes_dir = scenes_dir or config.scenes_dir
+        fingerprint = analysis_fingerprint(config)
+        plan = plan_incremental(
+            scenes_dir, config.output_dir, revision_range, fingerprint,
+            entries_only=config.scene_entries_only
+        )
+
+        safe_print(f"📋 需要重新分析: {len(plan.to_analyze)} 个场景，复用结果: {len(plan.reused)} 个场景")
+        for scene_key, output_name in sorted(plan.reused.items()):
+            safe_print(f"  ♻️  {scene_key} -> {output_name}")
+        for scene_key, reason in sorted(plan.to_analyze.items()):
+            safe_print(f"  🔄 {scene_key} ({reason})")
+        safe_print("")
+
+        if not plan.to_analyze:
+            safe_print("✅ 没有受影响的场景，全部复用已保存结果")
+            return
+
+        rag_engine = create_rag_engine(config)
+        manifest = load_manifest(config.output_dir)
+
+        failed = []
+        for scene_key in sorted(plan.to_analyze):
+            scene_text = read_input_file(plan.scene_path(scene_key))
+            try:
+                result = rag_engine.analyze(
+                    scene_text,
+                    api_key=config.api_key,
+                    api_base=config.api_base
+                )
+            except TimeoutError:
+                # 超时的场景不写入清单，下次运行时会重新分析
+                safe_print(f"⚠️  {scene_key} 超过截止时间 {config.scene_deadline}s，已跳过")
+                failed.append(scene_key)
+                continue
+            output_path = save_output(result, config.output_dir, scene_output_name(scene_key), config.output_format)
+            manifest[scene_key] = {
+                "output": output_path.name,
+                "revision": current_revision(plan.scenes_dir),
+                "fingerprint": fingerprint,
+            }
+
+            # 每个场景完成后立即写入清单，中断后可继续复用
+            save_manifest(manifest, config.output_dir)
+
+        safe_print(f"✅ 增量分析完成，共重新分析 {len(plan.to_analyze) - len(failed)} 个场景")
+        if failed:
+            safe_print(f"⚠️  {len(failed)} 个场景超时: {', '.join(failed)}")
+        print_cascade_stats(rag_engine)
+        print_latency_stats(rag_engine)
+
+    except FileNotFoundError as e:
+        safe_print(f"\n❌ 文件错误: {e}")
+        sys.exit(1)
+    except ValueError as e:
+        safe_print(f"\n❌ 数据错误: {e}")
+        sys.exit(1)
+    except Exception as e:
+        safe_print(f"\n❌ 执行失败: {type(e).__name__}: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        if rag_engine is not None:
+            rag_engine.close()
+
+
+def ingest_logs(config: Config, log_files: list, output_file: str = None, run_marker: str = None,
+                use_mmap: bool = False, min_support: float = 0.0, scenes_dir: Path = None,
+                prefix: str = None):
+    """
+    从设备运行日志构建生命周期真值
+
+    只识别场景源码中已知组件的日志，和/或紧跟在应用日志前缀之后的日志。
+
+    Args:
+        config: 配置对象
+        log_files: 日志文件路径列表
+        output_file: 输出文件名（可选）
+        run_marker: 运行分隔正则（可选）
+        use_mmap: 是否使用内存映射读取
+        min_support: 边至少出现在该比例的运行中才写入 order
+        scenes_dir: 场景目录（可选），从中收集已知组件名
+        prefix: 应用日志前缀正则（可选）
+    """
+    print_banner("运行日志生命周期采集")
+
+    try:
+        scenes_dir = scenes_dir or config.scenes_dir
+        components = set()
+        if scenes_dir and Path(scenes_dir).is_dir():
+            graph = ComponentDependencyGraph.from_directory(scenes_dir)
+            components = {component.name for component in graph.components.values()}
+            safe_print(f"📋 从 {scenes_dir} 收集到 {len(components)} 个已知组件")
+
+        ingester = LifecycleLogIngester(
+            components=components,
+            prefix=prefix,
+            run_marker=run_marker,
+            use_mmap=use_mmap
+        )
+        for log_file in log_files:
+            if not log_file.exists():
+                raise FileNotFoundError(f"未找到日志文件：{log_file}")
+            runs = ingester.ingest_file(log_file)
+            safe_print(f"✅ 已读取日志: {log_file} ({runs} 次运行)")
+
+        if ingester.runs == 0:
+            raise ValueError("日志中没有识别到生命周期回调")
+
+        result = ingester.to_lifecycle(min_support=min_support)
+        safe_print(f"📊 共 {ingester.runs} 次运行，{len(result['edgeFrequencies'])} 条不同的边")
+        for edge in result["edgeFrequencies"]:
+            safe_print(f"  {edge['pred']} → {edge['succ']}: {edge['count']} 次 / {edge['runs']} 次运行")
+
+        filename = output_file or "ground_truth.json"
+        save_output(json.dumps(result, ensure_ascii=False), config.output_dir, filename, config.output_format)
 
     except FileNotFoundError as e:
         safe_print(f"\n❌ 文件错误: {e}")
@@ -144,6 +359,68 @@ def main():
         help="配置文件路径"
     )
 
+    # 增量分析命令
+    incremental_parser = subparsers.add_parser("incremental", help="基于 git 变更的增量分析")
+    incremental_parser.add_argument(
+        "--since", "-s",
+        type=str,
+        help="git 修订范围（如 HEAD~1..HEAD），不指定则全量分析"
+    )
+    incremental_parser.add_argument(
+        "--scenes-dir", "-d",
+        type=str,
+        help="场景目录"
+    )
+    incremental_parser.add_argument(
+        "--config", "-c",
+        type=str,
+        help="配置文件路径"
+    )
+
+    # 日志采集命令
+    logs_parser = subparsers.add_parser("ingest-logs", help="从设备运行日志构建生命周期真值")
+    logs_parser.add_argument(
+        "logs",
+        nargs="+",
+        help="日志文件路径"
+    )
+    logs_parser.add_argument(
+        "--output", "-o",
+        type=str,
+        help="输出文件名"
+    )
+    logs_parser.add_argument(
+        "--run-marker", "-r",
+        type=str,
+        help="运行分隔正则，匹配到的行开始一次新的运行"
+    )
+    logs_parser.add_argument(
+        "--mmap",
+        action="store_true",
+        help="使用内存映射读取日志"
+    )
+    logs_parser.add_argument(
+        "--min-support",
+        type=float,
+        default=0.0,
+        help="边至少出现在该比例的运行中才写入 order（0~1）"
+    )
+    logs_parser.add_argument(
+        "--scenes-dir", "-d",
+        type=str,
+        help="场景目录，只识别其中已定义组件的日志（默认使用配置中的 scenes_dir）"
+    )
+    logs_parser.add_argument(
+        "--prefix", "-p",
+        type=str,
+        help="应用日志前缀正则（如 \"app Log:\"），只识别紧跟在其后的日志"
+    )
+    logs_parser.add_argument(
+        "--config", "-c",
+        type=str,
+        help="配置文件路径"
+    )
+
     args = parser.parse_args()
 
     # 如果没有指定命令，默认执行分析
@@ -164,6 +441,21 @@ def main():
     elif args.command == "analyze":
         input_file = Path(args.input) if args.input else None
         analyze_lifecycle(config, input_file=input_file, output_file=args.output)
+    elif args.command == "incremental":
+        scenes_dir = Path(args.scenes_dir) if args.scenes_dir else None
+        incremental_analyze(config, revision_range=args.since, scenes_dir=scenes_dir)
+    elif args.command == "ingest-logs":
+        log_files = [Path(log) for log in args.logs]
+        ingest_logs(
+            config,
+            log_files,
+            output_file=args.output,
+            run_marker=args.run_marker,
+            use_mmap=args.mmap,
+            min_support=args.min_support,
+            scenes_dir=Path(args.scenes_dir) if args.scenes_dir else None,
+            prefix=args.prefix
+        )
     else:
         parser.print_help()
 
@@ -7,6 +7,8 @@ from pathlib import Path
 from typing import Optional
 import yaml
 
+from .graph_format import OUTPUT_FORMATS
+
 
 class Config:
     """RAG 系统配置类"""
@@ -17,6 +19,9 @@ class Config:
 
         Args:
             config_file: YAML 配置文件路径，如果为 None 则使用默认配置
+
+        Raises:
+            ValueError: 配置项取值无效
         """
         # 项目根目录
         self.project_root = Path(__file__).parent.parent
@@ -24,13 +29,25 @@ class Config:
         # 默认配置
         self.vector_store_path = self.project_root / "vector_store"
         self.input_file = self.project_root / "data" / "inputs" / "input.txt"
+        self.scenes_dir = self.project_root / "data" / "inputs"
+        # 增量分析只把包含 @Entry 组件的文件视为场景，其余文件仅作为依赖
+        self.scene_entries_only = True
         self.output_dir = self.project_root / "data" / "outputs" / "json"
+        # 输出格式: json / binary（.alcg 列式二进制）/ both
+        self.output_format = "json"
         self.visualization_dir = self.project_root / "data" / "outputs" / "visualizations"
         self.pdf_path = self.project_root / "data" / "docs" / "arkUI自定义组件生命周期.pdf"
 
         # LLM 配置
         self.model_name = "deepseek-chat"
         self.temperature = 0
+        # 模型级联：按从快到慢排列，为空时只使用 model_name
+        self.model_cascade = []
+
+        # 截止时间与对冲请求配置
+        self.scene_deadline = 0
+        self.hedge_percentile = 95
+        self.hedge_min_samples = 5
 
         # API 配置 - 支持从环境变量读取
         self.api_key = os.getenv("DEEPSEEK_API_KEY") or os.getenv("OPENAI_API_KEY")
@@ -41,10 +58,18 @@ class Config:
         self.chunk_overlap = 200
         self.retriever_k = 4
 
+        # 组件分解配置
+        self.decompose_threshold = 0
+        self.decompose_mode = "llm"
+        self.max_concurrency = 4
+
         # 如果提供了配置文件，加载并覆盖默认配置
         if config_file and os.path.exists(config_file):
             self.load_from_yaml(config_file)
 
+        if self.output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"不支持的输出格式: {self.output_format}（可选: {', '.join(OUTPUT_FORMATS)}）")
+
     def load_from_yaml(self, config_file: str):
         """从 YAML 文件加载配置"""
         with open(config_file, 'r', encoding='utf-8') as f:
@@ -64,13 +89,23 @@ class Config:
         return {
             "vector_store_path": str(self.vector_store_path),
             "input_file": str(self.input_file),
+            "scenes_dir": str(self.scenes_dir),
+            "scene_entries_only": self.scene_entries_only,
             "output_dir": str(self.output_dir),
+            "output_format": self.output_format,
             "pdf_path": str(self.pdf_path),
             "model_name": self.model_name,
             "temperature": self.temperature,
+            "model_cascade": self.model_cascade,
+            "scene_deadline": self.scene_deadline,
+            "hedge_percentile": self.hedge_percentile,
+            "hedge_min_samples": self.hedge_min_samples,
             "chunk_size": self.chunk_size,
             "chunk_overlap": self.chunk_overlap,
             "retriever_k": self.retriever_k,
+            "decompose_threshold": self.decompose_threshold,
+            "decompose_mode": self.decompose_mode,
+            "max_concurrency": self.max_concurrency,
         }
 
 
@@ -0,0 +1,239 @@
+"""
+组件分解模块
+
+将包含多个 @Component struct 的大型场景拆分为组件树，
+分别得到每个组件的局部生命周期，再在实例化位置拼接为全局 order。
+"""
+
+import json
+from typing import Dict, List, Optional
+
+from .dependency import ComponentDependencyGraph, ComponentInfo, ComponentKey
+from .utils import extract_json_from_markdown, parse_function_name
+
+
+# 组件挂载阶段的回调顺序（build 必定存在）
+APPEAR_HOOKS = ("aboutToAppear", "build", "onDidBuild")
+
+# 页面级回调，仅 @Entry 组件有效
+PAGE_SHOW_HOOKS = ("onPageShow",)
+PAGE_HIDE_HOOKS = ("onPageHide",)
+
+# 组件卸载阶段的回调
+DISAPPEAR_HOOKS = ("aboutToDisappear",)
+
+# 已知回调的作用域与描述，用于生成 functions 列表
+HOOK_INFO = {
+    "aboutToAppear": ("component", "组件即将出现时触发，在 build 之前执行，用于初始化操作"),
+    "build": ("component", "UI声明式构建方法，状态变化时重新执行"),
+    "onDidBuild": ("component", "组件完成构建后触发，用于构建后的处理"),
+    "aboutToDisappear": ("component", "组件即将销毁时触发，用于清理资源"),
+    "onPageShow": ("page", "页面每次显示时触发"),
+    "onPageHide": ("page", "页面每次隐藏时触发"),
+}
+
+
+class ComponentLifecycle:
+    """单个组件的局部生命周期（不含子组件）"""
+
+    def __init__(self, name: str, appear: List[str], disappear: List[str], source: str = "rule"):
+        """
+        初始化局部生命周期
+
+        Args:
+            name: 组件名
+            appear: 挂载阶段的回调名（不带组件前缀），按执行顺序排列
+            disappear: 卸载阶段的回调名（不带组件前缀），按执行顺序排列
+            source: 来源，"rule" 表示规则推导，"llm" 表示模型分析
+        """
+        self.name = name
+        self.appear = appear
+        self.disappear = disappear
+        self.source = source
+
+    def __repr__(self) -> str:
+        return f"ComponentLifecycle({self.name!r}, appear={self.appear!r}, disappear={self.disappear!r})"
+
+
+def derive_local_lifecycle(component: ComponentInfo) -> ComponentLifecycle:
+    """
+    根据组件中定义的方法规则推导局部生命周期
+
+    Args:
+        component: 组件信息
+
+    Returns:
+        局部生命周期
+    """
+    appear = [hook for hook in APPEAR_HOOKS if hook == "build" or hook in component.methods]
+    disappear = [hook for hook in DISAPPEAR_HOOKS if hook in component.methods]
+
+    if component.is_entry:
+        appear += [hook for hook in PAGE_SHOW_HOOKS if hook in component.methods]
+        disappear = [hook for hook in PAGE_HIDE_HOOKS if hook in component.methods] + disappear
+
+    return ComponentLifecycle(component.name, appear, disappear)
+
+
+def parse_local_lifecycle(content: str, component: ComponentInfo) -> Optional[ComponentLifecycle]:
+    """
+    从模型对单个组件的分析结果中提取该组件自身的局部生命周期
+
+    只保留 pred 和 succ 都属于该组件的边，按边的先后串成调用序列；
+    卸载相关回调归入 disappear，其余归入 appear。
+
+    Args:
+        content: 模型输出（可能包含 markdown 代码块的 JSON）
+        component: 组件信息
+
+    Returns:
+        局部生命周期，无法解析或没有有效边时返回 None
+    """
+    try:
+        data = json.loads(extract_json_from_markdown(content))
+        order = data["lifecycle"]["order"]
+    except (json.JSONDecodeError, KeyError, TypeError):
+        return None
+
+    prefix = f"{component.name}."
+    sequence = []
+    for edge in order:
+        if not isinstance(edge, dict):
+            continue
+        for key in ("pred", "succ"):
+            name = edge.get(key, "")
+            if isinstance(name, str) and name.startswith(prefix):
+                hook = parse_function_name(name)
+                if hook not in sequence:
+                    sequence.append(hook)
+
+    if "build" not in sequence:
+        return None
+
+    hide_hooks = DISAPPEAR_HOOKS + PAGE_HIDE_HOOKS
+    appear = [hook for hook in sequence if hook not in hide_hooks]
+    disappear = [hook for hook in sequence if hook in hide_hooks]
+    return ComponentLifecycle(component.name, appear, disappear, source="llm")
+
+
+def find_roots(graph: ComponentDependencyGraph) -> List[ComponentKey]:
+    """
+    找出组件树的根：优先使用 @Entry 组件，否则使用没有父组件的组件
+
+    Args:
+        graph: 组件依赖图
+
+    Returns:
+        根组件键列表
+    """
+    entries = [key for key, c in graph.components.items() if c.is_entry]
+    if entries:
+        return entries
+    roots = [key for key in graph.components if not graph.parents_of(key)]
+    return roots or list(graph.components)[:1]
+
+
+def stitch_lifecycles(
+    graph: ComponentDependencyGraph,
+    lifecycles: Dict[ComponentKey, ComponentLifecycle]
+) -> List[dict]:
+    """
+    在实例化位置拼接各组件的局部生命周期，生成全局 order
+
+    挂载阶段：父组件的挂载回调执行完后，按实例化顺序依次挂载子组件（深度优先）。
+    卸载阶段：严格按照"从父到子"的顺序执行 aboutToDisappear。
+
+    Args:
+        graph: 组件依赖图
+        lifecycles: 组件键 -> 局部生命周期
+
+    Returns:
+        order 边列表（"组件名.函数名" 格式）
+    """
+    appear_sequence = []
+    disappear_sequence = []
+    page_show = []
+    visited = set()
+
+    def visit(key: ComponentKey):
+        if key in visited or key not in lifecycles:
+            return
+        visited.add(key)
+        lifecycle = lifecycles[key]
+        name = lifecycle.name
+        for hook in lifecycle.appear:
+            target = page_show if hook in PAGE_SHOW_HOOKS else appear_sequence
+            target.append(f"{name}.{hook}")
+        disappear_sequence.extend(f"{name}.{hook}" for hook in lifecycle.disappear)
+        for child in graph.children_of(key):
+            visit(child)
+
+    for root in find_roots(graph):
+        visit(root)
+
+    # 页面显示回调在整棵组件树挂载完成后触发
+    appear_sequence.extend(page_show)
+
+    order = []
+    for sequence in (appear_sequence, disappear_sequence):
+        order.extend({"pred": pred, "succ": succ} for pred, succ in zip(sequence, sequence[1:]))
+    return order
+
+
+def describe_dynamic_behavior(graph: ComponentDependencyGraph) -> str:
+    """
+    根据条件渲染的实例化关系生成动态行为说明
+
+    Args:
+        graph: 组件依赖图
+
+    Returns:
+        动态行为描述
+    """
+    notes = []
+    for component in graph.components.values():
+        for child_key in component.child_keys:
+            child_info = graph.components[child_key]
+            child = child_info.name
+            if child not in component.conditional_children:
+                continue
+            appear = " → ".join(
+                f"{child}.{hook}" for hook in APPEAR_HOOKS
+                if hook == "build" or hook in child_info.methods
+            )
+            note = f"{component.name} 中条件渲染的 {child} 被创建时依次触发 {appear}"
+            if "aboutToDisappear" in child_info.methods:
+                note += f"；条件不满足被移除时触发 {child}.aboutToDisappear"
+            notes.append(note)
+
+    notes.append("组件删除顺序严格遵循从父到子的原则，父组件的aboutToDisappear先于子组件执行。")
+    return "。".join(note.rstrip("。") for note in notes) + "。"
+
+
+def build_lifecycle_result(
+    graph: ComponentDependencyGraph,
+    lifecycles: Dict[ComponentKey, ComponentLifecycle]
+) -> dict:
+    """
+    组装与单次分析相同结构的 lifecycle 结果
+
+    Args:
+        graph: 组件依赖图
+        lifecycles: 组件键 -> 局部生命周期
+
+    Returns:
+        {"lifecycle": {...}} 结构的字典
+    """
+    functions = {}
+    for lifecycle in lifecycles.values():
+        for hook in lifecycle.appear + lifecycle.disappear:
+            scope, description = HOOK_INFO.get(hook, ("component", ""))
+            functions.setdefault(hook, {"name": hook, "scope": scope, "description": description})
+
+    return {
+        "lifecycle": {
+            "functions": [functions[name] for name in sorted(functions)],
+            "order": stitch_lifecycles(graph, lifecycles),
+            "dynamicBehavior": describe_dynamic_behavior(graph),
+        }
+    }
@@ -0,0 +1,476 @@
+"""
+组件依赖分析模块
+
+从 ArkTS (.ets) 源码中解析 struct 定义及其实例化关系，
+构建父组件 -> 子组件的依赖图（例如 SimpleDemo 在 build 中实例化 SimpleChild()）。
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+# struct 声明（前面可带 @Entry / @Component 等装饰器）
+STRUCT_PATTERN = re.compile(r'((?:@\w+(?:\([^)]*\))?\s*)*)\bstruct\s+([A-Za-z_]\w*)\s*\{')
+
+# 组件实例化调用，如 SimpleChild() / SimpleChild({ count: 1 })
+CALL_PATTERN = re.compile(r'\b([A-Za-z_]\w*)\s*\(')
+
+# struct 内部的方法定义，如 aboutToAppear() { / build(): void {
+METHOD_PATTERN = re.compile(r'(?:^|[;}\s])(?:async\s+)?([A-Za-z_]\w*)\s*\([^()]*\)\s*(?::\s*[^{};=]+)?\{')
+
+# 条件渲染语句块的开头，如 if (this.showChild) { / else {
+CONDITIONAL_PATTERN = re.compile(r'(?:\bif\s*\(.*\)|\belse)\s*$', re.S)
+
+# 不是方法名的关键字
+KEYWORDS = {"if", "for", "while", "switch", "catch", "function"}
+
+# 默认作为场景/源码扫描的文件类型
+DEFAULT_SOURCE_PATTERNS = ("*.ets", "*.txt")
+
+# 组件键：(源文件, 组件名)，单份源码时源文件为 None
+ComponentKey = Tuple[Optional[Path], str]
+
+
+def strip_comments(source: str) -> str:
+    """
+    移除 ArkTS 源码中的注释，保留字符串字面量和换行
+
+    Args:
+        source: 源码文本
+
+    Returns:
+        去掉注释后的源码（字符位置与换行数保持一致）
+    """
+    result = []
+    i = 0
+    length = len(source)
+    quote = None
+
+    while i < length:
+        ch = source[i]
+
+        if quote:
+            result.append(ch)
+            if ch == '\\' and i + 1 < length:
+                result.append(source[i + 1])
+                i += 2
+                continue
+            if ch == quote:
+                quote = None
+            i += 1
+            continue
+
+        if ch in ('"', "'", '`'):
+            quote = ch
+            result.append(ch)
+            i += 1
+        elif source.startswith('//', i):
+            end = source.find('\n', i)
+            end = length if end == -1 else end
+            result.append(' ' * (end - i))
+            i = end
+        elif source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            end = length if end == -1 else end + 2
+            # 保留换行，保证行号不变
+            result.append(''.join('\n' if c == '\n' else ' ' for c in source[i:end]))
+            i = end
+        else:
+            result.append(ch)
+            i += 1
+
+    return ''.join(result)
+
+
+def find_matching_brace(source: str, open_index: int) -> int:
+    """
+    查找与 open_index 处左花括号匹配的右花括号位置
+
+    Args:
+        source: 已去除注释的源码
+        open_index: 左花括号所在位置
+
+    Returns:
+        右花括号位置，未找到时返回源码末尾
+    """
+    depth = 0
+    quote = None
+    i = open_index
+
+    while i < len(source):
+        ch = source[i]
+        if quote:
+            if ch == '\\':
+                i += 2
+                continue
+            if ch == quote:
+                quote = None
+        elif ch in ('"', "'", '`'):
+            quote = ch
+        elif ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+
+    return len(source) - 1
+
+
+def top_level_text(body: str) -> str:
+    """
+    只保留 struct 花括号内最外层的源码，嵌套块的内容替换为空格
+
+    Args:
+        body: struct 花括号内的源码
+
+    Returns:
+        与 body 等长的文本
+    """
+    result = []
+    depth = 0
+    for ch in body:
+        if ch == '{':
+            result.append(ch if depth == 0 else ' ')
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            result.append(ch if depth == 0 else ' ')
+        else:
+            result.append(ch if depth == 0 or ch == '\n' else ' ')
+    return ''.join(result)
+
+
+def parse_methods(body: str) -> List[str]:
+    """
+    解析 struct 中定义的方法名（如 aboutToAppear、build）
+
+    Args:
+        body: struct 花括号内的源码
+
+    Returns:
+        按定义顺序排列的方法名列表
+    """
+    methods = []
+    for match in METHOD_PATTERN.finditer(top_level_text(body)):
+        name = match.group(1)
+        if name not in KEYWORDS and name not in methods:
+            methods.append(name)
+    return methods
+
+
+def is_conditional(body: str, position: int) -> bool:
+    """
+    判断 body 中 position 处的调用是否位于 if / else 条件渲染块内
+
+    Args:
+        body: struct 花括号内的源码
+        position: 调用所在位置
+
+    Returns:
+        是否为条件渲染
+    """
+    depth = 0
+    for i in range(position - 1, -1, -1):
+        ch = body[i]
+        if ch == '}':
+            depth += 1
+        elif ch == '{':
+            if depth == 0:
+                line_start = body.rfind('\n', 0, i) + 1
+                if CONDITIONAL_PATTERN.search(body[line_start:i]):
+                    return True
+            else:
+                depth -= 1
+    return False
+
+
+class ComponentInfo:
+    """单个 struct 组件的解析结果"""
+
+    def __init__(self, name: str, file: Path, decorators: List[str], body: str, source: str = ""):
+        """
+        初始化组件信息
+
+        Args:
+            name: 组件（struct）名称
+            file: 定义该组件的源文件
+            decorators: 装饰器列表（如 ["Entry", "Component"]）
+            body: struct 花括号内的源码
+            source: 包含装饰器的完整 struct 源码
+        """
+        self.name = name
+        self.file = file
+        self.decorators = decorators
+        self.body = body
+        self.source = source
+        self.methods = parse_methods(body)
+        # 按实例化顺序排列的子组件名
+        self.children: List[str] = []
+        # 子组件名解析后的组件键（见 ComponentDependencyGraph.resolve）
+        self.child_keys: List[ComponentKey] = []
+        # 在条件渲染块（if / else）中实例化的子组件名
+        self.conditional_children: Set[str] = set()
+
+    @property
+    def key(self) -> "ComponentKey":
+        """组件键：(源文件, 组件名)"""
+        return (self.file, self.name)
+
+    @property
+    def is_entry(self) -> bool:
+        """是否为 @Entry 页面组件"""
+        return "Entry" in self.decorators
+
+    def __repr__(self) -> str:
+        return f"ComponentInfo({self.name!r}, children={self.children!r})"
+
+
+def parse_components(source: str, file: Optional[Path] = None) -> List[ComponentInfo]:
+    """
+    解析源码中定义的所有 struct 组件（不解析实例化关系）
+
+    Args:
+        source: ArkTS 源码
+        file: 源文件路径（可选）
+
+    Returns:
+        按定义顺序排列的组件列表
+    """
+    code = strip_comments(source)
+    components = []
+
+    for match in STRUCT_PATTERN.finditer(code):
+        decorators = re.findall(r'@(\w+)', match.group(1))
+        open_index = match.end() - 1
+        close_index = find_matching_brace(code, open_index)
+        body = code[open_index + 1:close_index]
+        struct_source = code[match.start():close_index + 1].strip()
+        components.append(ComponentInfo(match.group(2), file, decorators, body, struct_source))
+
+    return components
+
+
+class ComponentDependencyGraph:
+    """
+    组件依赖图：记录每个 struct 实例化了哪些子 struct
+
+    组件以 (源文件, 组件名) 为键，不同场景中的同名 struct（如 Index、Child）互不覆盖。
+    实例化的子组件名优先解析为同一文件中的 struct，找不到时再匹配其他文件中的同名 struct。
+    """
+
+    def __init__(self):
+        """初始化空依赖图"""
+        self.components: Dict[ComponentKey, ComponentInfo] = {}
+        # 源文件 -> 该文件中定义的组件键
+        self.file_components: Dict[Optional[Path], List[ComponentKey]] = {}
+        # 组件名 -> 定义了该名称的组件键
+        self.name_index: Dict[str, List[ComponentKey]] = {}
+        self._linked = True
+
+    def add_source(self, source: str, file: Optional[Path] = None):
+        """
+        添加一份源码，解析其中的组件定义
+
+        实例化关系在全部源码添加完成后统一解析（见 link）。
+
+        Args:
+            source: ArkTS 源码
+            file: 源文件路径（可选）
+        """
+        self.file_components.setdefault(file, [])
+        for component in parse_components(source, file):
+            key = component.key
+            if key not in self.components:
+                self.file_components[file].append(key)
+                self.name_index.setdefault(component.name, []).append(key)
+            self.components[key] = component
+        self._linked = False
+
+    def add_file(self, filepath: Path):
+        """
+        添加一个源文件
+
+        Args:
+            filepath: 源文件路径
+        """
+        filepath = Path(filepath).resolve()
+        with open(filepath, "r", encoding="utf-8") as f:
+            self.add_source(f.read(), filepath)
+
+    @classmethod
+    def from_source(cls, source: str) -> "ComponentDependencyGraph":
+        """
+        从单份源码构建依赖图
+
+        Args:
+            source: ArkTS 源码
+
+        Returns:
+            依赖图实例
+        """
+        graph = cls()
+        graph.add_source(source)
+        graph.link()
+        return graph
+
+    @classmethod
+    def from_files(cls, files: Iterable[Path]) -> "ComponentDependencyGraph":
+        """
+        从多个源文件构建依赖图
+
+        Args:
+            files: 源文件路径
+
+        Returns:
+            依赖图实例
+        """
+        graph = cls()
+        for filepath in files:
+            graph.add_file(filepath)
+        graph.link()
+        return graph
+
+    @classmethod
+    def from_directory(
+        cls,
+        directory: Path,
+        patterns: Iterable[str] = DEFAULT_SOURCE_PATTERNS
+    ) -> "ComponentDependencyGraph":
+        """
+        递归扫描目录，构建依赖图
+
+        Args:
+            directory: 源码目录
+            patterns: 文件匹配模式
+
+        Returns:
+            依赖图实例
+        """
+        return cls.from_files(iter_source_files(directory, patterns))
+
+    def resolve(self, name: str, file: Optional[Path] = None) -> List[ComponentKey]:
+        """
+        将组件名解析为组件键：优先同一文件，否则为其他文件中的全部同名组件
+
+        Args:
+            name: 组件名
+            file: 发起实例化的源文件
+
+        Returns:
+            组件键列表，未找到时为空
+        """
+        if (file, name) in self.components:
+            return [(file, name)]
+        return list(self.name_index.get(name, []))
+
+    def link(self):
+        """解析所有组件的实例化关系（每个组件的源码只扫描一次）"""
+        for component in self.components.values():
+            children = []
+            child_keys = []
+            conditional = set()
+            for match in CALL_PATTERN.finditer(component.body):
+                name = match.group(1)
+                keys = [key for key in self.resolve(name, component.file) if key != component.key]
+                if not keys:
+                    continue
+                if name not in children:
+                    children.append(name)
+                    child_keys.extend(key for key in keys if key not in child_keys)
+                if is_conditional(component.body, match.start()):
+                    conditional.add(name)
+            component.children = children
+            component.child_keys = child_keys
+            component.conditional_children = conditional
+        self._linked = True
+
+    def _ensure_linked(self):
+        """添加源码后尚未解析实例化关系时先解析"""
+        if not self._linked:
+            self.link()
+
+    def children_of(self, key: ComponentKey) -> List[ComponentKey]:
+        """
+        获取组件直接实例化的子组件
+
+        Args:
+            key: 组件键
+
+        Returns:
+            子组件键列表（按实例化顺序）
+        """
+        self._ensure_linked()
+        component = self.components.get(key)
+        return list(component.child_keys) if component else []
+
+    def parents_of(self, key: ComponentKey) -> List[ComponentKey]:
+        """
+        获取直接实例化该组件的父组件
+
+        Args:
+            key: 组件键
+
+        Returns:
+            父组件键列表
+        """
+        self._ensure_linked()
+        return [c.key for c in self.components.values() if key in c.child_keys]
+
+    def descendants(self, key: ComponentKey) -> Set[ComponentKey]:
+        """
+        获取组件（含自身）传递实例化的全部组件
+
+        Args:
+            key: 组件键
+
+        Returns:
+            组件键集合
+        """
+        self._ensure_linked()
+        seen = set()
+        stack = [key]
+        while stack:
+            current = stack.pop()
+            if current in seen or current not in self.components:
+                continue
+            seen.add(current)
+            stack.extend(self.components[current].child_keys)
+        return seen
+
+    def file_dependencies(self, file: Path) -> Set[Path]:
+        """
+        获取某个源文件（场景）所依赖的全部源文件（含自身）
+
+        Args:
+            file: 源文件路径
+
+        Returns:
+            源文件路径集合
+        """
+        file = Path(file).resolve()
+        files = {file}
+        for key in self.file_components.get(file, []):
+            for dependency in self.descendants(key):
+                files.add(self.components[dependency].file)
+        return files
+
+
+def iter_source_files(directory: Path, patterns: Iterable[str] = DEFAULT_SOURCE_PATTERNS) -> List[Path]:
+    """
+    递归列出目录下匹配的源文件
+
+    Args:
+        directory: 源码目录
+        patterns: 文件匹配模式
+
+    Returns:
+        排序后的绝对路径列表
+    """
+    directory = Path(directory)
+    files = set()
+    for pattern in patterns:
+        files.update(p.resolve() for p in directory.rglob(pattern) if p.is_file())
+    return sorted(files)
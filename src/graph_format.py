@@ -0,0 +1,170 @@
+"""
+二进制调用图格式模块
+
+将生命周期结果编码为列式二进制格式（.alcg），供 TypeScript 端 CallGraph.fromBuffer 零拷贝加载。
+
+格式（所有整数均为小端 uint32，除版本号和标志位为 uint16）：
+
+    头部（28 字节）:
+        magic               4 字节 "ALCG"
+        version             uint16
+        flags               uint16（保留，当前为 0）
+        string_count        uint32
+        node_count          uint32
+        edge_count          uint32
+        string_bytes_length uint32
+        dynamic_behavior    uint32（字符串 ID，无则为 0xFFFFFFFF）
+    string_offsets          uint32[string_count + 1]，字符串 i 为 bytes[offsets[i]:offsets[i+1]]
+    nodes                   uint32[node_count * 3]，每个节点为 (name, scope, description) 字符串 ID
+    edges                   uint32[edge_count * 2]，每条边为 (pred, succ) 字符串 ID
+    string_bytes            UTF-8 字符串表
+"""
+
+import struct
+from typing import Dict, List
+
+MAGIC = b"ALCG"
+FORMAT_VERSION = 1
+NO_STRING = 0xFFFFFFFF
+HEADER = struct.Struct("<4sHHIIIII")
+
+# 二进制输出文件扩展名
+BINARY_SUFFIX = ".alcg"
+
+# 支持的输出格式：JSON、二进制调用图、两者都输出
+OUTPUT_FORMATS = ("json", "binary", "both")
+
+
+class StringTable:
+    """字符串驻留表：相同字符串只存储一次"""
+
+    def __init__(self):
+        """初始化空字符串表"""
+        self.ids: Dict[str, int] = {}
+        self.strings: List[str] = []
+
+    def intern(self, value: str) -> int:
+        """
+        返回字符串的 ID，首次出现时加入表中
+
+        Args:
+            value: 字符串
+
+        Returns:
+            字符串 ID
+        """
+        value = "" if value is None else str(value)
+        if value not in self.ids:
+            self.ids[value] = len(self.strings)
+            self.strings.append(value)
+        return self.ids[value]
+
+
+def _pack_u32(values: List[int]) -> bytes:
+    """将整数列表打包为小端 uint32 数组"""
+    return struct.pack(f"<{len(values)}I", *values)
+
+
+def _object_list(lifecycle: dict, key: str) -> List[dict]:
+    """取出 lifecycle 中的对象数组（缺失时为空），结构无效时抛出 ValueError"""
+    if key not in lifecycle:
+        return []
+    items = lifecycle[key]
+    if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+        raise ValueError(f"lifecycle.{key} 必须是对象数组，无法编码为二进制调用图")
+    return items
+
+
+def encode_lifecycle(data: dict) -> bytes:
+    """
+    将 {"lifecycle": {...}} 结构编码为二进制调用图
+
+    Args:
+        data: 生命周期结果（与 JSON 输出结构相同）
+
+    Returns:
+        二进制内容
+
+    Raises:
+        ValueError: 缺少 lifecycle 字段，或 functions / order 不是对象数组
+    """
+    lifecycle = data.get("lifecycle") if isinstance(data, dict) else None
+    if not isinstance(lifecycle, dict):
+        raise ValueError("缺少 lifecycle 字段，无法编码为二进制调用图")
+
+    table = StringTable()
+    nodes = []
+    for func in _object_list(lifecycle, "functions"):
+        nodes.extend((
+            table.intern(func.get("name")),
+            table.intern(func.get("scope")),
+            table.intern(func.get("description")),
+        ))
+
+    edges = []
+    for edge in _object_list(lifecycle, "order"):
+        edges.extend((table.intern(edge.get("pred")), table.intern(edge.get("succ"))))
+
+    dynamic_behavior = lifecycle.get("dynamicBehavior")
+    dynamic_id = NO_STRING if dynamic_behavior is None else table.intern(dynamic_behavior)
+
+    encoded = [s.encode("utf-8") for s in table.strings]
+    offsets = [0]
+    for item in encoded:
+        offsets.append(offsets[-1] + len(item))
+    string_bytes = b"".join(encoded)
+
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, 0,
+        len(table.strings), len(nodes) // 3, len(edges) // 2, len(string_bytes), dynamic_id
+    )
+    return header + _pack_u32(offsets) + _pack_u32(nodes) + _pack_u32(edges) + string_bytes
+
+
+def decode_lifecycle(buffer: bytes) -> dict:
+    """
+    将二进制调用图解码为 {"lifecycle": {...}} 结构
+
+    Args:
+        buffer: 二进制内容
+
+    Returns:
+        生命周期结果
+
+    Raises:
+        ValueError: 格式无效
+    """
+    if len(buffer) < HEADER.size:
+        raise ValueError("二进制调用图头部不完整")
+
+    magic, version, _, string_count, node_count, edge_count, string_length, dynamic_id = HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError("不是有效的二进制调用图（magic 不匹配）")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"不支持的二进制调用图版本: {version}")
+
+    offset = HEADER.size
+    columns = []
+    for count in (string_count + 1, node_count * 3, edge_count * 2):
+        columns.append(struct.unpack_from(f"<{count}I", buffer, offset))
+        offset += count * 4
+    offsets, nodes, edges = columns
+
+    if len(buffer) < offset + string_length:
+        raise ValueError("二进制调用图内容不完整")
+    string_bytes = buffer[offset:offset + string_length]
+    strings = [string_bytes[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(string_count)]
+
+    lifecycle = {
+        "functions": [
+            {"name": strings[nodes[i]], "scope": strings[nodes[i + 1]], "description": strings[nodes[i + 2]]}
+            for i in range(0, len(nodes), 3)
+        ],
+        "order": [
+            {"pred": strings[edges[i]], "succ": strings[edges[i + 1]]}
+            for i in range(0, len(edges), 2)
+        ],
+    }
+    if dynamic_id != NO_STRING:
+        lifecycle["dynamicBehavior"] = strings[dynamic_id]
+    return {"lifecycle": lifecycle}
@@ -0,0 +1,299 @@
+"""
+对冲请求模块
+
+为 LLM 调用提供截止时间控制和对冲请求：当一次调用的耗时超过在线统计的延迟分位数时，
+再发送一份相同的请求，采用先完成的结果，以降低长尾延迟。
+
+调用以协程（如 chain.ainvoke）的形式在后台事件循环中执行，
+落后的请求和超过截止时间的请求会被真正取消，而不是在后台继续运行。
+"""
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+
+
+class LatencyTracker:
+    """在线延迟统计：保留最近 window 次调用的耗时"""
+
+    def __init__(self, window: int = 1000):
+        """
+        初始化延迟统计
+
+        Args:
+            window: 参与统计的最近调用次数
+        """
+        self.samples = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float):
+        """
+        记录一次调用耗时
+
+        Args:
+            seconds: 耗时（秒）
+        """
+        with self._lock:
+            self.samples.append(seconds)
+
+    def percentile(self, p: float) -> Optional[float]:
+        """
+        计算延迟分位数（最近秩法）
+
+        Args:
+            p: 分位数（0~100）
+
+        Returns:
+            分位数对应的耗时（秒），没有样本时返回 None
+        """
+        with self._lock:
+            ordered = sorted(self.samples)
+        if not ordered:
+            return None
+        rank = max(1, math.ceil(p / 100 * len(ordered)))
+        return ordered[rank - 1]
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+
+# 未指定调用类别时使用的统计键
+DEFAULT_KEY = "default"
+
+
+class CallStats:
+    """一类调用（如同一模型的同一种查询）的延迟与对冲统计"""
+
+    def __init__(self, window: int = 1000):
+        """
+        初始化统计
+
+        Args:
+            window: 延迟统计窗口大小
+        """
+        self.latency = LatencyTracker(window)
+        self.calls = 0
+        self.hedges = 0
+        self.timeouts = 0
+
+    def summary(self) -> Dict[str, float]:
+        """
+        返回统计摘要
+
+        Returns:
+            包含 p50 / p95 / p99（秒，仅统计成功的调用）、调用次数、对冲率和超时次数的字典
+        """
+        return {
+            "p50": self.latency.percentile(50),
+            "p95": self.latency.percentile(95),
+            "p99": self.latency.percentile(99),
+            "calls": self.calls,
+            "hedge_rate": self.hedges / self.calls if self.calls else 0.0,
+            "timeouts": self.timeouts,
+        }
+
+
+class HedgedInvoker:
+    """带截止时间和对冲请求的调用器"""
+
+    def __init__(
+        self,
+        hedge_percentile: float = 95,
+        min_samples: int = 5,
+        window: int = 1000
+    ):
+        """
+        初始化调用器，并在守护线程中启动后台事件循环
+
+        延迟按调用类别（key，如 "模型名/scene"）分别统计，每类调用只用自己的分位数决定是否对冲，
+        避免快模型的延迟分布让慢模型的调用几乎全部被对冲。
+
+        Args:
+            hedge_percentile: 超过该延迟分位数仍未返回时发送对冲请求，0 表示不对冲
+            min_samples: 样本数达到该值后才开始对冲（样本不足时分位数不可靠）
+            window: 延迟统计窗口大小
+        """
+        self.hedge_percentile = hedge_percentile
+        self.min_samples = min_samples
+        self.window = window
+        # 调用类别 -> 统计（只在事件循环线程中修改）
+        self.call_stats: Dict[str, CallStats] = {}
+
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="hedged-llm", daemon=True)
+        self._thread.start()
+
+    def _stats_for(self, key: str) -> CallStats:
+        """返回调用类别的统计，首次使用时创建"""
+        stats = self.call_stats.get(key)
+        if stats is None:
+            stats = self.call_stats[key] = CallStats(self.window)
+        return stats
+
+    def hedge_delay(self, key: str = DEFAULT_KEY) -> Optional[float]:
+        """
+        返回发送对冲请求前的等待时间
+
+        Args:
+            key: 调用类别
+
+        Returns:
+            等待秒数，不对冲时返回 None
+        """
+        stats = self.call_stats.get(key)
+        if not self.hedge_percentile or stats is None or len(stats.latency) < self.min_samples:
+            return None
+        return stats.latency.percentile(self.hedge_percentile)
+
+    async def _hedged(self, afn: Callable[..., Awaitable], args: tuple, deadline: Optional[float], key: str):
+        """
+        在事件循环中执行一次调用，必要时发送对冲请求
+
+        记录的耗时从本次调用开始计算（包含对冲前的等待）。超时的调用只计入超时次数，
+        不参与分位数：被截止时间截断的等待时间只是真实耗时的下界，会把分位数拉低。
+        """
+        stats = self._stats_for(key)
+        stats.calls += 1
+        start = time.monotonic()
+        if deadline is not None and start >= deadline:
+            stats.timeouts += 1
+            raise TimeoutError("LLM 调用超过截止时间")
+
+        pending = {asyncio.ensure_future(afn(*args))}
+        delay = self.hedge_delay(key)
+        hedged = False
+        error = None
+
+        try:
+            while pending:
+                now = time.monotonic()
+                timeout = None if deadline is None else max(0.0, deadline - now)
+                if not hedged and delay is not None:
+                    hedge_in = max(0.0, start + delay - now)
+                    timeout = hedge_in if timeout is None else min(timeout, hedge_in)
+
+                done, pending = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    if task.exception() is None:
+                        stats.latency.record(time.monotonic() - start)
+                        return task.result()
+                    error = task.exception()
+
+                if deadline is not None and time.monotonic() >= deadline:
+                    stats.timeouts += 1
+                    raise TimeoutError("LLM 调用超过截止时间")
+
+                # 首次请求超过对冲阈值仍未返回（或已失败），发送一份相同的请求
+                if not hedged and delay is not None:
+                    hedged = True
+                    stats.hedges += 1
+                    pending.add(asyncio.ensure_future(afn(*args)))
+        finally:
+            # 取消落后的请求（包括超时时仍在执行的请求）
+            for task in pending:
+                task.cancel()
+
+        raise error
+
+    def _run(self, coro: Awaitable):
+        """在后台事件循环中执行协程并等待结果，调用方被中断时取消该协程"""
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def invoke(
+        self,
+        afn: Callable[..., Awaitable],
+        *args,
+        deadline: Optional[float] = None,
+        key: str = DEFAULT_KEY
+    ):
+        """
+        执行调用，必要时发送对冲请求
+
+        Args:
+            afn: 被调用的协程函数（如 chain.ainvoke）
+            *args: 函数参数
+            deadline: 截止时间（time.monotonic() 的绝对值），为 None 时不限制
+            key: 调用类别，延迟和对冲阈值按类别分别统计
+
+        Returns:
+            先成功完成的调用结果
+
+        Raises:
+            TimeoutError: 超过截止时间仍未完成
+        """
+        return self._run(self._hedged(afn, args, deadline, key))
+
+    def invoke_all(
+        self,
+        afn: Callable[..., Awaitable],
+        args_list: Sequence[tuple],
+        deadline: Optional[float] = None,
+        max_concurrency: int = 4,
+        key: str = DEFAULT_KEY
+    ) -> List[object]:
+        """
+        并发执行多次调用，每次调用都有对冲和截止时间控制
+
+        Args:
+            afn: 被调用的协程函数（如 chain.ainvoke）
+            args_list: 每次调用的参数元组
+            deadline: 所有调用共享的截止时间（time.monotonic() 的绝对值），为 None 时不限制
+            max_concurrency: 最大并发调用数
+            key: 调用类别，延迟和对冲阈值按类别分别统计
+
+        Returns:
+            与 args_list 一一对应的结果，失败或超时的调用对应其异常
+        """
+        async def run_all():
+            semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+            async def run(args):
+                async with semaphore:
+                    return await self._hedged(afn, args, deadline, key)
+
+            return await asyncio.gather(*(run(args) for args in args_list), return_exceptions=True)
+
+        return self._run(run_all())
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        返回各调用类别的延迟与对冲统计
+
+        Returns:
+            调用类别 -> 统计摘要（见 CallStats.summary）
+        """
+        return {key: stats.summary() for key, stats in list(self.call_stats.items())}
+
+    async def _cancel_all(self):
+        """取消事件循环中其余所有任务并等待它们结束"""
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def shutdown(self, timeout: float = 5.0):
+        """
+        取消所有未完成的请求并停止后台事件循环
+
+        Args:
+            timeout: 等待请求取消完成的最长时间（秒）
+        """
+        if self.loop.is_closed():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._cancel_all(), self.loop).result(timeout)
+        except Exception:
+            pass
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
+        if not self._thread.is_alive():
+            self.loop.close()
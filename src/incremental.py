@@ -0,0 +1,260 @@
+"""
+增量分析模块
+
+根据 git 修订范围内变更的文件和组件依赖图，计算需要重新分析的最小场景集合，
+其余场景直接复用已保存的分析结果。
+"""
+
+import hashlib
+import json
+import subprocess
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from .config import Config, PROMPT_TEMPLATE
+from .dependency import ComponentDependencyGraph, DEFAULT_SOURCE_PATTERNS, iter_source_files
+
+
+# 增量分析清单文件名（保存在输出目录中）
+MANIFEST_FILENAME = "incremental_manifest.json"
+
+
+def run_git(args: List[str], cwd: Path) -> str:
+    """
+    执行 git 命令并返回标准输出
+
+    Args:
+        args: git 子命令参数
+        cwd: 工作目录
+
+    Returns:
+        命令输出
+
+    Raises:
+        ValueError: git 命令执行失败
+    """
+    try:
+        completed = subprocess.run(
+            ["git", *args],
+            cwd=str(cwd),
+            capture_output=True,
+            text=True,
+            encoding="utf-8",
+            check=True
+        )
+    except FileNotFoundError:
+        raise ValueError("未找到 git 命令，无法执行增量分析")
+    except subprocess.CalledProcessError as e:
+        raise ValueError(f"git {' '.join(args)} 执行失败: {e.stderr.strip()}")
+    return completed.stdout
+
+
+def changed_files(revision_range: str, cwd: Path) -> Set[Path]:
+    """
+    获取修订范围内变更的文件
+
+    Args:
+        revision_range: git 修订范围（如 "HEAD~1..HEAD"，单个修订表示与工作区比较）
+        cwd: 仓库内任意目录
+
+    Returns:
+        变更文件的绝对路径集合
+    """
+    toplevel = Path(run_git(["rev-parse", "--show-toplevel"], cwd).strip())
+    output = run_git(["diff", "--name-only", revision_range, "--"], cwd)
+    return {(toplevel / line.strip()).resolve() for line in output.splitlines() if line.strip()}
+
+
+def current_revision(cwd: Path) -> Optional[str]:
+    """
+    获取当前 HEAD 的提交哈希
+
+    Args:
+        cwd: 仓库内任意目录
+
+    Returns:
+        提交哈希，不在 git 仓库中时返回 None
+    """
+    try:
+        return run_git(["rev-parse", "HEAD"], cwd).strip()
+    except ValueError:
+        return None
+
+
+def analysis_fingerprint(config: Config) -> str:
+    """
+    计算影响分析结果的配置指纹（Prompt、模型及相关参数）
+
+    Args:
+        config: 配置对象
+
+    Returns:
+        指纹（sha256 十六进制）
+    """
+    settings = {
+        "prompt": PROMPT_TEMPLATE,
+        "model_name": config.model_name,
+        "model_cascade": config.model_cascade,
+        "temperature": config.temperature,
+        "retriever_k": config.retriever_k,
+        "chunk_size": config.chunk_size,
+        "chunk_overlap": config.chunk_overlap,
+        "decompose_threshold": config.decompose_threshold,
+        "decompose_mode": config.decompose_mode,
+    }
+    encoded = json.dumps(settings, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def load_manifest(output_dir: Path) -> Dict[str, dict]:
+    """
+    加载增量分析清单
+
+    Args:
+        output_dir: 输出目录
+
+    Returns:
+        场景相对路径 -> 记录（output 文件名、分析时的 revision、配置 fingerprint）
+    """
+    manifest_file = Path(output_dir) / MANIFEST_FILENAME
+    if not manifest_file.exists():
+        return {}
+    with open(manifest_file, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_manifest(manifest: Dict[str, dict], output_dir: Path) -> Path:
+    """
+    保存增量分析清单
+
+    Args:
+        manifest: 清单内容
+        output_dir: 输出目录
+
+    Returns:
+        清单文件路径
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest_file = output_dir / MANIFEST_FILENAME
+    with open(manifest_file, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2, sort_keys=True)
+    return manifest_file
+
+
+def scene_output_name(scene_key: str) -> str:
+    """
+    根据场景相对路径生成输出文件名
+
+    例如: "pages/SimpleDemo.ets" -> "pages__SimpleDemo.json"
+
+    Args:
+        scene_key: 场景相对路径（POSIX 格式）
+
+    Returns:
+        输出文件名
+    """
+    stem = scene_key.rsplit('.', 1)[0]
+    return stem.replace('/', '__') + ".json"
+
+
+class IncrementalPlan:
+    """增量分析计划：需要重新分析的场景与可复用的场景"""
+
+    def __init__(self, scenes_dir: Path):
+        """
+        初始化分析计划
+
+        Args:
+            scenes_dir: 场景根目录
+        """
+        self.scenes_dir = Path(scenes_dir).resolve()
+        # 场景相对路径 -> 重新分析原因
+        self.to_analyze: Dict[str, str] = {}
+        # 场景相对路径 -> 已保存的输出文件名
+        self.reused: Dict[str, str] = {}
+
+    def scene_path(self, scene_key: str) -> Path:
+        """返回场景文件的绝对路径"""
+        return self.scenes_dir / scene_key
+
+    def __repr__(self) -> str:
+        return f"IncrementalPlan(to_analyze={len(self.to_analyze)}, reused={len(self.reused)})"
+
+
+def plan_incremental(
+    scenes_dir: Path,
+    output_dir: Path,
+    revision_range: Optional[str],
+    fingerprint: Optional[str] = None,
+    patterns: Iterable[str] = DEFAULT_SOURCE_PATTERNS,
+    entries_only: bool = True
+) -> IncrementalPlan:
+    """
+    计算需要重新分析的最小场景集合
+
+    默认只有包含 @Entry 组件的文件才是场景；只定义子组件的文件仅作为依赖参与变更判断，
+    不单独发送给模型分析。
+
+    场景需要重新分析的条件：
+    - 清单中没有该场景的记录，或记录的输出文件已不存在
+    - 记录的配置指纹与当前不一致（Prompt、模型等发生变化）
+    - 记录的分析版本缺失或在仓库中已不存在
+    - 场景自身或其（传递）实例化的任一子组件所在文件在修订范围内，
+      或自记录的分析版本以来（含工作区未提交的修改）发生变更
+
+    Args:
+        scenes_dir: 场景根目录（其中每个源文件视为一个场景）
+        output_dir: 输出目录（存放分析结果和清单）
+        revision_range: git 修订范围，为 None 时全部重新分析
+        fingerprint: 当前配置指纹（见 analysis_fingerprint），为 None 时不检查
+        patterns: 场景文件匹配模式
+        entries_only: 是否只把包含 @Entry 组件的文件视为场景，为 False 时每个源文件都是场景
+
+    Returns:
+        增量分析计划
+    """
+    plan = IncrementalPlan(scenes_dir)
+    source_files = iter_source_files(plan.scenes_dir, patterns)
+    graph = ComponentDependencyGraph.from_files(source_files)
+    scene_files = [
+        f for f in source_files
+        if not entries_only or any(graph.components[key].is_entry for key in graph.file_components.get(f, []))
+    ]
+
+    changed = changed_files(revision_range, plan.scenes_dir) if revision_range else None
+    manifest = load_manifest(output_dir)
+    # 分析版本 -> 自该版本以来变更的文件（版本不可用时为 None）
+    changed_since: Dict[str, Optional[Set[Path]]] = {}
+
+    for scene_file in scene_files:
+        scene_key = scene_file.relative_to(plan.scenes_dir).as_posix()
+        record = manifest.get(scene_key)
+
+        if changed is None:
+            plan.to_analyze[scene_key] = "全量分析"
+            continue
+        if record is None or not (Path(output_dir) / record["output"]).exists():
+            plan.to_analyze[scene_key] = "无已保存结果"
+            continue
+        if fingerprint is not None and record.get("fingerprint") != fingerprint:
+            plan.to_analyze[scene_key] = "分析配置或 Prompt 已变更"
+            continue
+
+        revision = record.get("revision")
+        if revision and revision not in changed_since:
+            try:
+                changed_since[revision] = changed_files(revision, plan.scenes_dir)
+            except ValueError:
+                changed_since[revision] = None
+        if not revision or changed_since[revision] is None:
+            plan.to_analyze[scene_key] = "分析版本不可用"
+        else:
+            dirty = graph.file_dependencies(scene_file) & (changed | changed_since[revision])
+            if dirty:
+                names = ", ".join(sorted(p.name for p in dirty))
+                plan.to_analyze[scene_key] = f"依赖文件变更: {names}"
+            else:
+                plan.reused[scene_key] = record["output"]
+
+    return plan
@@ -0,0 +1,291 @@
+"""
+运行日志采集模块
+
+流式读取设备运行日志（如 console.info('SimpleDemo aboutToAppear') 的输出），
+提取生命周期回调的实际执行顺序，生成与 save_output 相同结构的 order 边列表，
+并在多次运行之间聚合边的出现频次，作为校验 LLM 输出的真值。
+"""
+
+import mmap
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Tuple
+
+from .decompose import HOOK_INFO
+
+
+# 默认识别的生命周期回调
+DEFAULT_HOOKS = tuple(HOOK_INFO) + ("onBackPress", "aboutToReuse", "aboutToRecycle")
+
+# 流式读取的块大小
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def compile_hook_pattern(
+    hooks: Iterable[str] = DEFAULT_HOOKS,
+    components: Optional[Iterable[str]] = None,
+    prefix: Optional[str] = None
+) -> Pattern[bytes]:
+    """
+    预编译生命周期日志匹配模式
+
+    匹配 "组件名 回调名" 或 "组件名.回调名"。为避免把系统日志（如 "WindowManager: Start build"）
+    误识别为回调，组件名限定为 components 中的已知组件，和/或要求紧跟在 prefix（应用日志 tag）之后。
+    组件名和回调名分别位于命名分组 component 和 hook 中，prefix 中的捕获分组不影响读取。
+
+    Args:
+        hooks: 需要识别的回调名
+        components: 已知组件名（可选），不指定时接受任意标识符
+        prefix: 日志前缀正则（可选，如 "app Log:"），组件名必须紧跟在其后
+
+    Returns:
+        编译后的 bytes 正则
+
+    Raises:
+        re.error: prefix 不是有效的正则，或使用了 component / hook 分组名
+    """
+    names = b"|".join(re.escape(hook.encode("utf-8")) for hook in sorted(hooks, key=len, reverse=True))
+    if components:
+        component = b"(?P<component>" + b"|".join(
+            re.escape(name.encode("utf-8")) for name in sorted(set(components), key=len, reverse=True)
+        ) + b")"
+    else:
+        component = rb"(?P<component>[A-Za-z_]\w*)"
+
+    start = rb"(?:" + prefix.encode("utf-8") + rb")\s*" if prefix else b""
+    return re.compile(start + rb"\b" + component + rb"[ .:]+(?P<hook>" + names + rb")\b")
+
+
+def iter_lines(filepath: Path, chunk_size: int = DEFAULT_CHUNK_SIZE, use_mmap: bool = False) -> Iterator[bytes]:
+    """
+    以恒定内存逐行读取日志文件
+
+    Args:
+        filepath: 日志文件路径
+        chunk_size: 分块读取的块大小（字节）
+        use_mmap: 是否使用内存映射读取
+
+    Yields:
+        每一行的原始字节（不含换行符）
+    """
+    with open(filepath, "rb") as f:
+        if use_mmap:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # 空文件无法映射
+                return
+            with mm:
+                for line in iter(mm.readline, b""):
+                    yield line.rstrip(b"\r\n")
+            return
+
+        remainder = b""
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            lines = (remainder + chunk).split(b"\n")
+            remainder = lines.pop()
+            for line in lines:
+                yield line.rstrip(b"\r")
+        if remainder:
+            yield remainder.rstrip(b"\r")
+
+
+def iter_events(
+    lines: Iterable[bytes],
+    hook_pattern: Pattern[bytes],
+    run_marker: Optional[Pattern[bytes]] = None
+) -> Iterator[Optional[str]]:
+    """
+    逐行识别生命周期回调
+
+    Args:
+        lines: 日志行
+        hook_pattern: 生命周期日志匹配模式（见 compile_hook_pattern）
+        run_marker: 运行分隔模式（可选），匹配到的行开始一次新的运行
+
+    Yields:
+        按执行顺序的 "组件名.函数名"；遇到运行分隔行时产出 None
+    """
+    for line in lines:
+        if run_marker is not None and run_marker.search(line):
+            yield None
+            continue
+
+        match = hook_pattern.search(line)
+        if match:
+            yield f"{match.group('component').decode('utf-8')}.{match.group('hook').decode('utf-8')}"
+
+
+def events_to_order(events: List[str]) -> List[dict]:
+    """
+    将回调序列转换为 order 边列表（相邻的两次调用组成一条边）
+
+    Args:
+        events: "组件名.函数名" 列表
+
+    Returns:
+        order 边列表
+    """
+    return [
+        {"pred": pred, "succ": succ}
+        for pred, succ in zip(events, events[1:])
+        if pred != succ
+    ]
+
+
+class LifecycleLogIngester:
+    """跨多次运行聚合生命周期日志"""
+
+    def __init__(
+        self,
+        hooks: Iterable[str] = DEFAULT_HOOKS,
+        components: Optional[Iterable[str]] = None,
+        prefix: Optional[str] = None,
+        run_marker: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        use_mmap: bool = False
+    ):
+        """
+        初始化日志采集器
+
+        Args:
+            hooks: 需要识别的回调名
+            components: 已知组件名（如场景源码中的 struct），只识别这些组件的日志
+            prefix: 应用日志前缀正则（如 "app Log:"），只识别紧跟在其后的日志
+            run_marker: 运行分隔正则（可选），每个日志文件也总是单独作为运行
+            chunk_size: 分块读取的块大小（字节）
+            use_mmap: 是否使用内存映射读取
+
+        Raises:
+            ValueError: components 和 prefix 均未指定
+        """
+        if not components and not prefix:
+            raise ValueError("需要指定已知组件名或应用日志前缀，否则系统日志会被误识别为生命周期回调")
+        self.hook_pattern = compile_hook_pattern(hooks, components, prefix)
+        self.run_marker = re.compile(run_marker.encode("utf-8")) if run_marker else None
+        self.chunk_size = chunk_size
+        self.use_mmap = use_mmap
+
+        self.runs = 0
+        # 边 -> 总出现次数
+        self.edge_counts: Counter = Counter()
+        # 边 -> 出现该边的运行次数
+        self.edge_runs: Counter = Counter()
+        # 边的首次出现顺序
+        self.edge_order: Dict[Tuple[str, str], int] = {}
+        self.hooks_seen = set()
+
+        # 当前运行的状态：只保留上一个回调和本次运行出现过的不同边
+        self._previous: Optional[str] = None
+        self._run_edges = set()
+        self._run_events = 0
+
+    def _add_event(self, event: str):
+        """记录当前运行中的一次回调，与上一次回调组成一条边"""
+        self.hooks_seen.add(event.split('.', 1)[1])
+        if self._previous is not None and self._previous != event:
+            edge = (self._previous, event)
+            self.edge_counts[edge] += 1
+            self._run_edges.add(edge)
+            self.edge_order.setdefault(edge, len(self.edge_order))
+        self._previous = event
+        self._run_events += 1
+
+    def _finish_run(self):
+        """结束当前运行（没有识别到回调的运行不计数）"""
+        if self._run_events:
+            self.runs += 1
+            self.edge_runs.update(self._run_edges)
+        self._previous = None
+        self._run_edges = set()
+        self._run_events = 0
+
+    def add_run(self, events: List[str]) -> List[dict]:
+        """
+        记录一次运行
+
+        Args:
+            events: 该次运行的回调序列
+
+        Returns:
+            该次运行的 order 边列表
+        """
+        for event in events:
+            self._add_event(event)
+        self._finish_run()
+        return events_to_order(events)
+
+    def ingest_file(self, filepath: Path) -> int:
+        """
+        流式读取一个日志文件
+
+        边的计数随日志行逐条更新，内存占用与日志长度无关。
+
+        Args:
+            filepath: 日志文件路径
+
+        Returns:
+            该文件中识别到的运行次数
+        """
+        lines = iter_lines(Path(filepath), self.chunk_size, self.use_mmap)
+        runs_before = self.runs
+        for event in iter_events(lines, self.hook_pattern, self.run_marker):
+            if event is None:
+                self._finish_run()
+            else:
+                self._add_event(event)
+        self._finish_run()
+        return self.runs - runs_before
+
+    def edge_frequencies(self) -> List[dict]:
+        """
+        返回聚合后的边频次（按首次出现顺序）
+
+        Returns:
+            包含 pred、succ、count（总次数）、runs（出现的运行数）的列表
+        """
+        return [
+            {
+                "pred": pred,
+                "succ": succ,
+                "count": self.edge_counts[(pred, succ)],
+                "runs": self.edge_runs[(pred, succ)],
+            }
+            for pred, succ in sorted(self.edge_order, key=self.edge_order.get)
+        ]
+
+    def to_lifecycle(self, min_support: float = 0.0) -> dict:
+        """
+        生成与 save_output 相同结构的真值结果
+
+        Args:
+            min_support: 边至少出现在该比例的运行中才写入 order（0~1）
+
+        Returns:
+            {"lifecycle": {...}, "runs": ..., "edgeFrequencies": [...]} 结构的字典
+        """
+        frequencies = self.edge_frequencies()
+        order = [
+            {"pred": edge["pred"], "succ": edge["succ"]}
+            for edge in frequencies
+            if self.runs and edge["runs"] / self.runs >= min_support
+        ]
+
+        functions = []
+        for hook in sorted(self.hooks_seen):
+            scope, description = HOOK_INFO.get(hook, ("component", ""))
+            functions.append({"name": hook, "scope": scope, "description": description})
+
+        return {
+            "lifecycle": {
+                "functions": functions,
+                "order": order,
+                "dynamicBehavior": f"由 {self.runs} 次运行日志聚合得到的实际调用顺序",
+            },
+            "runs": self.runs,
+            "edgeFrequencies": frequencies,
+        }
@@ -2,12 +2,20 @@
 RAG 引擎核心模块
 """
 
+import json
+import time
+from typing import Dict, List, Optional
+
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.runnables import RunnablePassthrough
 from langchain_openai import ChatOpenAI
 from langchain.prompts import PromptTemplate
 
 from .config import PROMPT_TEMPLATE
+from .decompose import build_lifecycle_result, derive_local_lifecycle, parse_local_lifecycle
+from .dependency import ComponentDependencyGraph
+from .hedging import HedgedInvoker
+from .validation import validate_lifecycle
 from .vectorstore import VectorStoreManager
 from .utils import format_docs, safe_print
 
@@ -20,7 +28,14 @@ class RAGEngine:
         vectorstore_manager: VectorStoreManager,
         model_name: str = "deepseek-chat",
         temperature: float = 0,
-        retriever_k: int = 4
+        retriever_k: int = 4,
+        decompose_threshold: int = 0,
+        decompose_mode: str = "llm",
+        max_concurrency: int = 4,
+        model_cascade: Optional[List[dict]] = None,
+        scene_deadline: float = 0,
+        hedge_percentile: float = 95,
+        hedge_min_samples: int = 5
     ):
         """
         初始化 RAG 引擎
@@ -30,20 +45,43 @@ class RAGEngine:
             model_name: LLM 模型名称
             temperature: 生成温度
             retriever_k: 检索的文档数量
+            decompose_threshold: 场景中 struct 数量达到该值时按组件分解分析，0 表示不分解
+            decompose_mode: 组件局部生命周期的来源，"llm" 为并行调用模型，"rule" 为规则推导
+            max_concurrency: 分解分析时的最大并发请求数
+            model_cascade: 模型级联配置，按从快到慢排列，每项包含 model_name，
+                可选 temperature 和 min_confidence；为空时只使用 model_name
+            scene_deadline: 单个场景的分析截止时间（秒），0 表示不限制
+            hedge_percentile: 调用耗时超过该延迟分位数时发送对冲请求，0 表示不对冲
+            hedge_min_samples: 开始对冲前需要积累的延迟样本数
         """
         self.vectorstore_manager = vectorstore_manager
         self.model_name = model_name
         self.temperature = temperature
         self.retriever_k = retriever_k
+        self.decompose_threshold = decompose_threshold
+        self.decompose_mode = decompose_mode
+        self.max_concurrency = max_concurrency
+        self.model_cascade = model_cascade or []
+        self.scene_deadline = scene_deadline
+        self.invoker = HedgedInvoker(
+            hedge_percentile=hedge_percentile,
+            min_samples=hedge_min_samples
+        )
         self.rag_chain = None
+        # 级联各层的推理链（按模型名缓存）
+        self.cascade_chains: Dict[str, object] = {}
+        # 级联各层的调用统计：模型名 -> {"calls": 调用次数, "escalations": 升级次数}
+        self.cascade_stats: Dict[str, Dict[str, int]] = {}
 
-    def build_chain(self, api_key=None, api_base=None):
+    def build_chain(self, api_key=None, api_base=None, model_name=None, temperature=None):
         """
         构建 RAG 推理链
 
         Args:
             api_key: API 密钥（可选）
             api_base: API 基础 URL（可选）
+            model_name: 模型名称（可选），不指定时使用默认模型并设置为 self.rag_chain
+            temperature: 生成温度（可选），不指定时使用默认温度
         """
         retriever = self.vectorstore_manager.get_retriever(k=self.retriever_k)
 
@@ -54,10 +92,13 @@ class RAGEngine:
 
         # 构建 LLM 参数
         llm_kwargs = {
-            "model_name": self.model_name,
-            "temperature": self.temperature
+            "model_name": model_name or self.model_name,
+            "temperature": self.temperature if temperature is None else temperature
         }
 
+        if self.scene_deadline:
+            # 保留客户端对 429/5xx 的重试，到达截止时间时由 HedgedInvoker 取消整个请求
+            llm_kwargs["timeout"] = self.scene_deadline
         if api_key:
             llm_kwargs["api_key"] = api_key
         if api_base:
@@ -65,14 +106,16 @@ class RAGEngine:
 
         llm = ChatOpenAI(**llm_kwargs)
 
-        self.rag_chain = (
+        chain = (
             {"context": retriever | format_docs, "question": RunnablePassthrough()}
             | prompt
             | llm
             | StrOutputParser()
         )
 
-        return self.rag_chain
+        if model_name is None:
+            self.rag_chain = chain
+        return chain
 
     def analyze(self, query: str, api_key=None, api_base=None) -> str:
         """
@@ -85,12 +128,152 @@ class RAGEngine:
 
         Returns:
             分析结果（JSON 格式）
+
+        Raises:
+            TimeoutError: 超过 scene_deadline 仍未完成
         """
+        deadline = time.monotonic() + self.scene_deadline if self.scene_deadline else None
+
+        if self.decompose_threshold > 0:
+            graph = ComponentDependencyGraph.from_source(query)
+            if len(graph.components) >= self.decompose_threshold:
+                return self.analyze_decomposed(graph, api_key=api_key, api_base=api_base, deadline=deadline)
+
+        if self.model_cascade:
+            return self.analyze_cascade(query, api_key=api_key, api_base=api_base, deadline=deadline)
+
         if self.rag_chain is None:
             safe_print("🔗 正在构建 RAG 推理链...")
             self.build_chain(api_key=api_key, api_base=api_base)
 
         safe_print("🤔 正在分析生命周期调用顺序...\n")
-        result = self.rag_chain.invoke(query)
+        result = self.invoker.invoke(
+            self.rag_chain.ainvoke, query, deadline=deadline, key=f"{self.model_name}/scene"
+        )
 
         return result
+
+    def analyze_cascade(self, query: str, api_key=None, api_base=None, deadline=None) -> str:
+        """
+        按模型级联执行分析：先用最快的模型，校验失败或置信度不足时升级到下一层
+
+        某一层调用失败时同样计为升级并尝试下一层；最后一层的结果无论是否通过校验都会返回，
+        最后一层失败或已超过截止时间时抛出异常。
+
+        Args:
+            query: 用户查询（ArkTS 代码场景）
+            api_key: API 密钥（可选）
+            api_base: API 基础 URL（可选）
+            deadline: 所有层共享的截止时间（time.monotonic() 的绝对值，可选）
+
+        Returns:
+            分析结果（JSON 格式）
+
+        Raises:
+            TimeoutError: 超过截止时间仍未完成
+        """
+        result = ""
+        for index, tier in enumerate(self.model_cascade):
+            model_name = tier["model_name"]
+            chain = self.cascade_chains.get(model_name)
+            if chain is None:
+                safe_print(f"🔗 正在构建 RAG 推理链 ({model_name})...")
+                chain = self.build_chain(
+                    api_key=api_key,
+                    api_base=api_base,
+                    model_name=model_name,
+                    temperature=tier.get("temperature")
+                )
+                self.cascade_chains[model_name] = chain
+
+            stats = self.cascade_stats.setdefault(model_name, {"calls": 0, "escalations": 0})
+            stats["calls"] += 1
+
+            safe_print(f"🤔 正在分析生命周期调用顺序 ({model_name})...\n")
+            last_tier = index == len(self.model_cascade) - 1
+            try:
+                result = self.invoker.invoke(chain.ainvoke, query, deadline=deadline, key=f"{model_name}/scene")
+            except Exception as e:
+                if last_tier or (deadline is not None and time.monotonic() >= deadline):
+                    raise
+                stats["escalations"] += 1
+                safe_print(f"⬆️  {model_name} 调用失败，升级到下一层模型: {type(e).__name__}: {e}")
+                continue
+
+            if last_tier:
+                break
+
+            validation = validate_lifecycle(result, scene_text=query)
+            min_confidence = tier.get("min_confidence", 0.8)
+            if validation.valid and validation.confidence >= min_confidence:
+                break
+
+            stats["escalations"] += 1
+            reasons = validation.issues or [f"置信度 {validation.confidence:.2f} 低于 {min_confidence}"]
+            safe_print(f"⬆️  {model_name} 的结果未通过校验，升级到下一层模型: {'; '.join(reasons[:3])}")
+
+        return result
+
+    def escalation_rates(self) -> Dict[str, float]:
+        """
+        返回级联各层的升级率
+
+        Returns:
+            模型名 -> 升级次数 / 调用次数
+        """
+        return {
+            model_name: stats["escalations"] / stats["calls"] if stats["calls"] else 0.0
+            for model_name, stats in self.cascade_stats.items()
+        }
+
+    def analyze_decomposed(self, graph: ComponentDependencyGraph, api_key=None, api_base=None, deadline=None) -> str:
+        """
+        按组件分解分析：并行得到每个组件的局部生命周期，再在实例化位置拼接
+
+        模型模式下每个 struct 单独作为一次查询并行发送，失败、超时或解析失败的组件回退到规则推导。
+
+        Args:
+            graph: 场景的组件依赖图
+            api_key: API 密钥（可选）
+            api_base: API 基础 URL（可选）
+            deadline: 所有组件共享的截止时间（time.monotonic() 的绝对值，可选）
+
+        Returns:
+            分析结果（JSON 格式）
+        """
+        components = list(graph.components.values())
+        safe_print(f"🧩 场景包含 {len(components)} 个组件，按组件分解分析...\n")
+
+        lifecycles = {}
+        if self.decompose_mode == "llm":
+            if self.rag_chain is None:
+                safe_print("🔗 正在构建 RAG 推理链...")
+                self.build_chain(api_key=api_key, api_base=api_base)
+
+            results = self.invoker.invoke_all(
+                self.rag_chain.ainvoke,
+                [(component.source,) for component in components],
+                deadline=deadline,
+                max_concurrency=self.max_concurrency,
+                key=f"{self.model_name}/component"
+            )
+            for component, result in zip(components, results):
+                if isinstance(result, Exception):
+                    safe_print(f"⚠️  组件 {component.name} 分析失败 ({result})，使用规则推导")
+                    continue
+                lifecycle = parse_local_lifecycle(result, component)
+                if lifecycle is None:
+                    safe_print(f"⚠️  组件 {component.name} 的结果无法解析，使用规则推导")
+                    continue
+                lifecycles[component.key] = lifecycle
+
+        for component in components:
+            if component.key not in lifecycles:
+                lifecycles[component.key] = derive_local_lifecycle(component)
+
+        result = build_lifecycle_result(graph, lifecycles)
+        return json.dumps(result, ensure_ascii=False, indent=2)
+
+    def close(self):
+        """取消未完成的请求并停止后台事件循环"""
+        self.invoker.shutdown()
@@ -9,6 +9,8 @@ from pathlib import Path
 from typing import List
 from datetime import datetime
 
+from .graph_format import BINARY_SUFFIX, OUTPUT_FORMATS, encode_lifecycle
+
 
 def safe_print(text: str):
     """
@@ -167,18 +169,26 @@ def normalize_json_format(json_data: dict) -> dict:
     return json_data
 
 
-def save_output(content: str, output_dir: Path, filename: str = None) -> Path:
+def save_output(content: str, output_dir: Path, filename: str = None, output_format: str = "json") -> Path:
     """
-    保存输出结果为 JSON 格式
+    保存输出结果为 JSON 和/或二进制调用图格式
 
     Args:
         content: 输出内容（可能包含 markdown 代码块的 JSON）
         output_dir: 输出目录
         filename: 文件名，如果为 None 则自动生成
+        output_format: "json"、"binary"（.alcg 列式二进制）或 "both"
 
     Returns:
-        输出文件路径
+        输出文件路径（"binary" 时为二进制文件路径，否则为 JSON 文件路径；
+        无法编码为二进制时为回退保存的 JSON 文件路径）
+
+    Raises:
+        ValueError: 不支持的输出格式
     """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"不支持的输出格式: {output_format}（可选: {', '.join(OUTPUT_FORMATS)}）")
+
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # 生成文件名
@@ -202,11 +212,32 @@ def save_output(content: str, output_dir: Path, filename: str = None) -> Path:
         # 标准化格式
         normalized_data = normalize_json_format(json_data)
 
-        # 保存为格式化的 JSON
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(normalized_data, f, ensure_ascii=False, indent=2)
-
-        safe_print(f"💾 结果已保存到: {output_file} (JSON 格式)")
+        if output_format in ("json", "both"):
+            # 保存为格式化的 JSON
+            with open(output_file, "w", encoding="utf-8") as f:
+                json.dump(normalized_data, f, ensure_ascii=False, indent=2)
+
+            safe_print(f"💾 结果已保存到: {output_file} (JSON 格式)")
+
+        if output_format in ("binary", "both"):
+            binary_file = output_file.with_suffix(BINARY_SUFFIX)
+            try:
+                # 先编码再打开文件，编码失败时不留下空文件
+                binary_data = encode_lifecycle(normalized_data)
+            except ValueError as e:
+                safe_print(f"⚠️  警告: 无法编码为二进制调用图 ({e})")
+                if output_format == "binary":
+                    # 回退到保存原始内容
+                    with open(output_file, "w", encoding="utf-8") as f:
+                        f.write(content)
+                    safe_print(f"💾 结果已保存到: {output_file} (原始格式)")
+            else:
+                with open(binary_file, "wb") as f:
+                    f.write(binary_data)
+
+                safe_print(f"💾 结果已保存到: {binary_file} (二进制调用图格式)")
+                if output_format == "binary":
+                    output_file = binary_file
 
     except json.JSONDecodeError as e:
         # 如果 JSON 解析失败，回退到保存原始内容
@@ -0,0 +1,123 @@
+"""
+结果校验模块
+
+检查模型输出是否符合生命周期 JSON 结构和调用顺序规则，并给出置信度。
+"""
+
+import json
+from typing import Dict, List, Optional, Set
+
+from .dependency import ComponentDependencyGraph
+from .utils import extract_json_from_markdown, extract_function_instances
+
+
+class ValidationResult:
+    """生命周期结果的校验结论"""
+
+    def __init__(self, issues: List[str], confidence: float):
+        """
+        初始化校验结论
+
+        Args:
+            issues: 发现的问题列表，为空表示通过校验
+            confidence: 置信度（0~1），为场景组件被 order 覆盖的比例
+        """
+        self.issues = issues
+        self.confidence = confidence
+
+    @property
+    def valid(self) -> bool:
+        """是否通过校验"""
+        return not self.issues
+
+    def __repr__(self) -> str:
+        return f"ValidationResult(valid={self.valid}, confidence={self.confidence:.2f}, issues={self.issues!r})"
+
+
+def _reachable(adjacency: Dict[str, Set[str]], start: str, target: str) -> bool:
+    """判断 order 边构成的图中 start 是否可达 target"""
+    seen = set()
+    stack = [start]
+    while stack:
+        node = stack.pop()
+        if node == target:
+            return True
+        if node in seen:
+            continue
+        seen.add(node)
+        stack.extend(adjacency.get(node, ()))
+    return False
+
+
+def validate_lifecycle(content: str, scene_text: Optional[str] = None) -> ValidationResult:
+    """
+    校验生命周期分析结果
+
+    检查项：
+    - 可解析为 JSON，且包含 lifecycle.functions / lifecycle.order 数组
+    - order 中每条边的 pred/succ 均为 "组件名.函数名" 格式，且包含 build
+    - 同一组件的 aboutToAppear 不晚于 build
+    - aboutToDisappear 严格按照"从父到子"的顺序执行（需要提供场景源码）
+
+    Args:
+        content: 模型输出（可能包含 markdown 代码块的 JSON）
+        scene_text: 场景源码（可选），用于检查父子顺序和计算置信度
+
+    Returns:
+        校验结论
+    """
+    try:
+        data = json.loads(extract_json_from_markdown(content))
+    except json.JSONDecodeError as e:
+        return ValidationResult([f"JSON 解析失败: {e}"], 0.0)
+
+    lifecycle = data.get("lifecycle") if isinstance(data, dict) else None
+    if not isinstance(lifecycle, dict):
+        return ValidationResult(["缺少 lifecycle 字段"], 0.0)
+
+    issues = []
+    functions = lifecycle.get("functions")
+    order = lifecycle.get("order")
+    if not isinstance(functions, list) or not all(isinstance(f, dict) and "name" in f for f in functions):
+        issues.append("functions 必须是包含 name 字段的对象数组")
+    if not isinstance(order, list) or not order:
+        issues.append("order 必须是非空数组")
+        return ValidationResult(issues, 0.0)
+
+    adjacency: Dict[str, Set[str]] = {}
+    valid_edges = []
+    for edge in order:
+        if not isinstance(edge, dict) or not isinstance(edge.get("pred"), str) or not isinstance(edge.get("succ"), str):
+            issues.append(f"无效的边: {edge}")
+            continue
+        valid_edges.append(edge)
+        for name in (edge["pred"], edge["succ"]):
+            if name.count('.') != 1 or not all(name.split('.')):
+                issues.append(f"函数实例名不是 \"组件名.函数名\" 格式: {name}")
+        adjacency.setdefault(edge["pred"], set()).add(edge["succ"])
+
+    instances = extract_function_instances(valid_edges)
+    components = {name.split('.')[0] for name in instances}
+    if not any(name.endswith(".build") for name in instances):
+        issues.append("order 中缺少 build")
+
+    for component in components:
+        appear, build = f"{component}.aboutToAppear", f"{component}.build"
+        if appear in instances and build in instances and _reachable(adjacency, build, appear):
+            issues.append(f"{appear} 应先于 {build} 执行")
+
+    confidence = 1.0
+    if scene_text:
+        graph = ComponentDependencyGraph.from_source(scene_text)
+        if graph.components:
+            covered = sum(1 for c in graph.components.values() if c.name in components)
+            confidence = covered / len(graph.components)
+
+        for parent in graph.components.values():
+            parent_hook = f"{parent.name}.aboutToDisappear"
+            for child in parent.children:
+                child_hook = f"{child}.aboutToDisappear"
+                if parent_hook in instances and child_hook in instances and _reachable(adjacency, child_hook, parent_hook):
+                    issues.append(f"aboutToDisappear 顺序错误: {parent_hook} 应先于 {child_hook}")
+
+    return ValidationResult(issues, confidence)